@@ -1,10 +1,20 @@
 import asyncio
-from typing import List, Dict, Optional
+import functools
+import time
+from typing import List, Dict, Optional, Protocol, Tuple
 from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum, auto
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from decimal import Decimal
 
+# Contract entry points called by the tracker
+_METHOD_CREATE_PROJECT = 'create-conservation-project'
+_METHOD_ADD_MILESTONES = 'add-project-milestones'
+_METHOD_ADD_IMPACT_METRICS = 'add-impact-metrics'
+
 class ProjectStatus(Enum):
     PROPOSED = auto()
     VOTING = auto()
@@ -14,50 +24,130 @@ class ProjectStatus(Enum):
     COMPLETED = auto()
     CLOSED = auto()
 
-@dataclass
+def _require_minor_units(name: str, value):
+    """
+    Reject amounts not given as integer minor units (cents, hundredths)
+    
+    :param name: Field name used in the error message
+    :param value: Amount to check
+    """
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise TypeError(
+            f"{name} must be an int in minor units, got {type(value).__name__}"
+        )
+
+@dataclass(frozen=True, slots=True)
 class Milestone:
+    """
+    Immutable project milestone; record completion with
+    dataclasses.replace(milestone, is_completed=True, completion_date=...)
+    """
     description: str
-    funding_percentage: float
+    funding_percentage: int
     is_completed: bool = False
     completion_date: Optional[datetime] = None
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ImpactMetric:
     metric_name: str
-    value: float
-    validator_approvals: List[str] = field(default_factory=list)
+    value: int  # Fixed-point, hundredths of a unit
+    validator_approvals: Tuple[str, ...] = ()
+    
+    def __post_init__(self):
+        _require_minor_units('ImpactMetric.value', self.value)
 
-@dataclass
+@dataclass(slots=True)
 class ConservationProject:
     """
     Enhanced Conservation Project with Advanced Governance
     """
     name: str
     description: str
-    target_funding: Decimal
-    current_funding: Decimal = Decimal('0.00')
+    target_funding: int  # Cents
+    current_funding: int = 0  # Cents
     status: ProjectStatus = ProjectStatus.PROPOSED
     owner: str = ''
     validators: List[str] = field(default_factory=list)
     voting_period: Optional[Tuple[datetime, datetime]] = None
     milestones: List[Milestone] = field(default_factory=list)
     impact_metrics: List[ImpactMetric] = field(default_factory=list)
+    
+    def __post_init__(self):
+        _require_minor_units('ConservationProject.target_funding', self.target_funding)
+        _require_minor_units('ConservationProject.current_funding', self.current_funding)
+    
+    @property
+    def target_funding_decimal(self) -> Decimal:
+        return Decimal(self.target_funding).scaleb(-2)
+    
+    @property
+    def current_funding_decimal(self) -> Decimal:
+        return Decimal(self.current_funding).scaleb(-2)
+
+class BlockchainClient(Protocol):
+    """
+    Contract interaction interface expected by the tracker
+    """
+    async def execute_contract_call(self, tx_params: Dict) -> Dict: ...
+    
+    async def get_project_details(self, project_id: int) -> Dict: ...
+
+def _log_tx_errors(label: str):
+    """
+    Log failures of a tracker coroutine before re-raising them
+    
+    :param label: Operation name used in the error log message
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                return await func(self, *args, **kwargs)
+            except Exception as e:
+                self.logger.error("%s failed: %s", label, e)
+                raise
+        return wrapper
+    return decorator
 
 class AdvancedConservationTracker:
     """
     Enhanced Blockchain-Based Conservation Project Management
     """
-    def __init__(self, blockchain_client, validator_registry):
+    def __init__(
+        self, 
+        blockchain_client: BlockchainClient, 
+        validator_registry, 
+        validator_cache_ttl: float = 300.0,
+        validator_cache_size: int = 10_000,
+        approval_timeout: float = 30.0
+    ):
         """
         Initialize advanced tracking system
         
+        The tracker runs on any asyncio event loop. On Linux, run it under
+        uvloop (``uvloop.install()`` at application start) to cut the
+        per-await scheduling overhead of its many small network calls.
+        
         :param blockchain_client: Blockchain interaction client
         :param validator_registry: External validator verification system
+        :param validator_cache_ttl: Seconds to reuse fetched validator details
+        :param validator_cache_size: Maximum number of cached validators
+        :param approval_timeout: Seconds to wait for validator votes on a metric
         """
-        self.blockchain_client = blockchain_client
+        self.blockchain_client: BlockchainClient = blockchain_client
         self.validator_registry = validator_registry
         self.logger = logging.getLogger(self.__class__.__name__)
+        
+        # Validator details cache: address -> (fetch time, details),
+        # kept in fetch order so the oldest entries are evicted first
+        self._validator_cache: Dict[str, Tuple[float, Optional[Dict]]] = {}
+        self._validator_cache_ttl = validator_cache_ttl
+        self._validator_cache_size = validator_cache_size
+        # In-flight validator lookups shared by concurrent callers
+        self._validator_fetches: Dict[str, asyncio.Future] = {}
+        self._approval_timeout = approval_timeout
     
+    @_log_tx_errors("Project creation")
     async def create_conservation_project(
         self, 
         project: ConservationProject, 
@@ -70,32 +160,30 @@ class AdvancedConservationTracker:
         :param proposed_validators: List of validator addresses
         :return: Project creation transaction response
         """
-        try:
-            # Validate proposed validators
-            validated_validators = await self._validate_validators(proposed_validators)
-            
-            # Prepare blockchain transaction
-            tx_params = {
-                'method': 'create-conservation-project',
-                'args': [
-                    project.name,
-                    project.description,
-                    int(project.target_funding * 100),  # Convert to cents
-                    validated_validators
-                ]
-            }
-            
-            # Execute blockchain transaction
-            response = await self.blockchain_client.execute_contract_call(tx_params)
-            
-            # Log project creation
-            self.logger.info(f"Project created: {project.name}")
-            
-            return response
+        # The project is mutable, so re-check the amount sent on chain
+        _require_minor_units('ConservationProject.target_funding', project.target_funding)
         
-        except Exception as e:
-            self.logger.error(f"Project creation failed: {e}")
-            raise
+        # Validate proposed validators
+        validated_validators = await self._validate_validators(proposed_validators)
+        
+        # Prepare blockchain transaction
+        tx_params = {
+            'method': _METHOD_CREATE_PROJECT,
+            'args': [
+                project.name,
+                project.description,
+                project.target_funding,
+                validated_validators
+            ]
+        }
+        
+        # Execute blockchain transaction
+        response = await self.blockchain_client.execute_contract_call(tx_params)
+        
+        # Log project creation
+        self.logger.info("Project created: %s", project.name)
+        
+        return response
     
     async def _validate_validators(self, proposed_validators: List[str]) -> List[str]:
         """
@@ -104,20 +192,145 @@ class AdvancedConservationTracker:
         :param proposed_validators: List of potential validator addresses
         :return: Verified validator list
         """
-        verified_validators = []
+        # Drop duplicate addresses, keeping first-seen order
+        proposed_validators = list(dict.fromkeys(proposed_validators))
+        if len(proposed_validators) < 2:
+            raise ValueError("Insufficient qualified validators")
         
-        for validator in proposed_validators:
-            # Check validator reputation and credentials
-            validator_info = await self.validator_registry.get_validator_details(validator)
-            
-            if validator_info and validator_info['reputation_score'] >= 75:
-                verified_validators.append(validator)
+        # Check validator reputation and credentials
+        validator_infos = await self._get_validators_details(proposed_validators)
+        
+        verified_validators = [
+            validator for validator in proposed_validators
+            if (info := validator_infos.get(validator)) and info.get('reputation_score', 0) >= 75
+        ]
         
         if len(verified_validators) < 2:
             raise ValueError("Insufficient qualified validators")
         
         return verified_validators
     
+    async def _get_validators_details(self, addresses: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch validator details, serving recent lookups from the local cache
+        
+        Concurrent callers missing the same address share a single
+        in-flight registry request. If the caller that started it is
+        cancelled, the others retry the lookup themselves.
+        
+        :param addresses: Validator addresses to look up
+        :return: Validator details keyed by address, for known validators only
+        """
+        now = time.monotonic()
+        validator_infos = {}
+        in_flight = {}
+        missing = []
+        for address in addresses:
+            cached = self._validator_cache.get(address)
+            if cached is not None:
+                if now - cached[0] < self._validator_cache_ttl:
+                    validator_infos[address] = cached[1]
+                    continue
+                # Evict stale entries as they are read
+                del self._validator_cache[address]
+            
+            fetch = self._validator_fetches.get(address)
+            if fetch is not None:
+                in_flight[address] = fetch
+            else:
+                missing.append(address)
+        
+        if missing:
+            loop = asyncio.get_running_loop()
+            fetches = {address: loop.create_future() for address in missing}
+            self._validator_fetches.update(fetches)
+            try:
+                results = await self._fetch_validators_details(missing)
+            except Exception as e:
+                for fetch in fetches.values():
+                    fetch.set_exception(e)
+                    # Waiters are optional; don't warn if none retrieve it
+                    fetch.exception()
+                raise
+            except BaseException:
+                # Waiting callers see the cancellation and fetch for themselves
+                for fetch in fetches.values():
+                    fetch.cancel()
+                raise
+            else:
+                now = time.monotonic()
+                for address, fetch in fetches.items():
+                    info = results[address]
+                    if isinstance(info, Exception):
+                        info = None
+                    else:
+                        self._cache_validator(address, info, now)
+                    validator_infos[address] = info
+                    fetch.set_result(info)
+            finally:
+                for address in fetches:
+                    del self._validator_fetches[address]
+        
+        orphaned = []
+        for address, fetch in in_flight.items():
+            try:
+                validator_infos[address] = await asyncio.shield(fetch)
+            except asyncio.CancelledError:
+                if not fetch.cancelled():
+                    raise
+                orphaned.append(address)
+        if orphaned:
+            validator_infos.update(await self._get_validators_details(orphaned))
+        
+        return {
+            address: info for address, info in validator_infos.items()
+            if isinstance(info, dict)
+        }
+    
+    def _cache_validator(self, address: str, info: Optional[Dict], now: float):
+        """
+        Store validator details, evicting expired and excess entries
+        
+        :param address: Validator address
+        :param info: Validator details, or None if unknown to the registry
+        :param now: Fetch time, from time.monotonic()
+        """
+        cache = self._validator_cache
+        cache.pop(address, None)
+        cache[address] = (now, info)
+        
+        # Entries are in fetch order: sweep expired ones, then cap the size
+        while cache:
+            oldest = next(iter(cache))
+            fetched_at = cache[oldest][0]
+            if now - fetched_at < self._validator_cache_ttl and len(cache) <= self._validator_cache_size:
+                break
+            del cache[oldest]
+    
+    async def _fetch_validators_details(self, addresses: List[str]) -> Dict[str, object]:
+        """
+        Query the registry for validator details
+        
+        :param addresses: Validator addresses to look up
+        :return: Details, None or the lookup exception, keyed by address
+        """
+        # Use a single JSON-RPC batch round-trip when the registry supports it
+        get_batch = getattr(self.validator_registry, 'get_validators_details_batch', None)
+        if get_batch is not None:
+            fetched = await get_batch(addresses)
+            return {address: fetched.get(address) for address in addresses}
+        
+        # Otherwise keep all per-validator lookups in flight concurrently
+        results = await asyncio.gather(
+            *(self.validator_registry.get_validator_details(address) for address in addresses),
+            return_exceptions=True
+        )
+        for address, info in zip(addresses, results):
+            if isinstance(info, Exception):
+                self.logger.warning("Validator lookup for %s failed: %s", address, info)
+        return dict(zip(addresses, results))
+    
+    @_log_tx_errors("Milestone addition")
     async def add_project_milestones(
         self, 
         project_id: int, 
@@ -130,35 +343,34 @@ class AdvancedConservationTracker:
         :param milestones: List of project milestones
         :return: Milestone addition transaction response
         """
-        try:
-            # Validate milestone percentages
-            total_percentage = sum(m.funding_percentage for m in milestones)
-            if total_percentage != 100:
-                raise ValueError("Milestone percentages must total 100%")
-            
-            # Prepare milestone data for blockchain
-            milestone_data = [
-                {
-                    'description': m.description, 
-                    'funding_percentage': int(m.funding_percentage)
-                } 
-                for m in milestones
-            ]
-            
-            tx_params = {
-                'method': 'add-project-milestones',
-                'args': [project_id, milestone_data]
-            }
-            
-            response = await self.blockchain_client.execute_contract_call(tx_params)
-            
-            self.logger.info(f"Milestones added to project {project_id}")
-            return response
+        if not milestones:
+            raise ValueError("At least one milestone is required")
         
-        except Exception as e:
-            self.logger.error(f"Milestone addition failed: {e}")
-            raise
+        # Validate milestone percentages
+        percentages = [m.funding_percentage for m in milestones]
+        if sum(percentages) != 100:
+            raise ValueError("Milestone percentages must total 100%")
+        
+        # Prepare milestone data for blockchain
+        milestone_data = [
+            {
+                'description': m.description, 
+                'funding_percentage': percentage
+            } 
+            for m, percentage in zip(milestones, percentages)
+        ]
+        
+        tx_params = {
+            'method': _METHOD_ADD_MILESTONES,
+            'args': [project_id, milestone_data]
+        }
+        
+        response = await self.blockchain_client.execute_contract_call(tx_params)
+        
+        self.logger.info("Milestones added to project %s", project_id)
+        return response
     
+    @_log_tx_errors("Impact validation")
     async def validate_project_impact(
         self, 
         project_id: int, 
@@ -171,32 +383,177 @@ class AdvancedConservationTracker:
         :param impact_metrics: List of impact metrics to validate
         :return: Impact validation transaction response
         """
+        # Fetch project validators
+        project_details = await self.blockchain_client.get_project_details(project_id)
+        project_validators = project_details.get('validators', [])
+        
+        # Collect validator approvals for all metrics in one concurrent wave
+        approval_rounds = [
+            asyncio.ensure_future(
+                self._collect_validator_approvals(project_validators, project_id, metric)
+            )
+            for metric in impact_metrics
+        ]
         try:
-            # Fetch project validators
-            project_details = await self.blockchain_client.get_project_details(project_id)
-            project_validators = project_details.get('validators', [])
-            
-            # Prepare validated metrics
-            validated_metrics = []
-            for metric in impact_metrics:
-                # Simulate validator voting process
-                metric_validators = await self._collect_validator_approvals(
-                    project_validators, 
-                    project_id, 
-                    metric
-                )
-                
-                validated_metrics.append({
-                    'metric_name': metric.metric_name,
-                    'value': int(metric.value * 100),  # Convert to fixed-point
-                    'validator_approvals': metric_validators
-                })
-            
-            tx_params = {
-                'method': 'add-impact-metrics',
-                'args': [project_id, validated_metrics]
+            all_approvals = await asyncio.gather(*approval_rounds)
+        except BaseException:
+            # One failed round fails the call; stop the others' vote requests
+            for approval_round in approval_rounds:
+                approval_round.cancel()
+            await asyncio.gather(*approval_rounds, return_exceptions=True)
+            raise
+        
+        # Prepare validated metrics
+        validated_metrics = [
+            {
+                'metric_name': metric.metric_name,
+                'value': metric.value,
+                'validator_approvals': approvals
             }
-            
-            response = await self.blockchain_client.execute_contract_call(tx_params)
-            
-            self.logger.info(f"Impact metrics validated for project {project_id}")
\ No newline at end of file
+            for metric, approvals in zip(impact_metrics, all_approvals)
+        ]
+        
+        tx_params = {
+            'method': _METHOD_ADD_IMPACT_METRICS,
+            'args': [project_id, validated_metrics]
+        }
+        
+        response = await self.blockchain_client.execute_contract_call(tx_params)
+        
+        self.logger.info("Impact metrics validated for project %s", project_id)
+        return response
+    
+    async def _collect_validator_approvals(
+        self, 
+        validators: List[str], 
+        project_id: int, 
+        metric: ImpactMetric
+    ) -> List[str]:
+        """
+        Collect validator votes on an impact metric in a single round
+        
+        Every validator is asked at once. Collection stops as soon as a
+        2/3 + 1 quorum has approved; votes arriving after that are
+        dropped. A round that ends without quorum, or is still open at
+        the approval timeout, fails.
+        
+        :param validators: Project validator addresses
+        :param project_id: Unique project identifier
+        :param metric: Impact metric under review
+        :return: Addresses of validators that approved the metric
+        """
+        vote_requests = [
+            asyncio.ensure_future(self._request_metric_vote(validator, project_id, metric))
+            for validator in validators
+        ]
+        quorum = (2 * len(validators)) // 3 + 1
+        
+        approvals = []
+        try:
+            for next_vote in asyncio.as_completed(vote_requests, timeout=self._approval_timeout):
+                validator, approved = await next_vote
+                if approved:
+                    approvals.append(validator)
+                    if len(approvals) >= quorum:
+                        break
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Approval round for project {project_id} "
+                f"metric {metric.metric_name} expired"
+            ) from None
+        finally:
+            for vote_request in vote_requests:
+                vote_request.cancel()
+            await asyncio.gather(*vote_requests, return_exceptions=True)
+        
+        if len(approvals) < quorum:
+            raise ValueError(f"Metric {metric.metric_name} lacks validator quorum")
+        
+        return approvals
+    
+    async def _request_metric_vote(
+        self, 
+        validator: str, 
+        project_id: int, 
+        metric: ImpactMetric
+    ) -> Tuple[str, bool]:
+        """
+        Request a single validator's vote on an impact metric
+        
+        :param validator: Validator address
+        :param project_id: Unique project identifier
+        :param metric: Impact metric under review
+        :return: Validator address and whether it approved the metric
+        """
+        try:
+            vote = await self.validator_registry.request_metric_approval(
+                validator, 
+                project_id, 
+                metric
+            )
+        except Exception as e:
+            self.logger.warning("Vote request to validator %s failed: %s", validator, e)
+            return validator, False
+        
+        return validator, vote is True
+
+# Queued logging set up by enable_queued_logging, keyed by logger name:
+# (listener, queue handler, logger's previous propagate setting)
+_queue_listeners: Dict[str, Tuple[QueueListener, QueueHandler, bool]] = {}
+
+def enable_queued_logging(
+    *handlers: logging.Handler, 
+    logger_name: str = AdvancedConservationTracker.__name__
+) -> QueueListener:
+    """
+    Move tracker log output off the transaction path
+    
+    Records are still formatted on the calling thread by the
+    QueueHandler, but the downstream handlers' locking and I/O run on a
+    background listener thread. Calling this again for the same logger
+    returns the already running listener; passing handlers then is an
+    error, since they would not be used. Call disable_queued_logging()
+    at application shutdown to flush pending records and restore the
+    logger.
+    
+    :param handlers: Handlers that emit the records, a StreamHandler by default
+    :param logger_name: Logger to reroute; tracker subclasses log under their own class name
+    :return: Started queue listener
+    """
+    existing = _queue_listeners.get(logger_name)
+    if existing is not None:
+        if handlers:
+            raise ValueError(f"Queued logging already enabled for {logger_name}")
+        return existing[0]
+    
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue, 
+        *(handlers or (logging.StreamHandler(),)), 
+        respect_handler_level=True
+    )
+    queue_handler = QueueHandler(log_queue)
+    
+    logger = logging.getLogger(logger_name)
+    _queue_listeners[logger_name] = (listener, queue_handler, logger.propagate)
+    logger.addHandler(queue_handler)
+    logger.propagate = False
+    
+    listener.start()
+    return listener
+
+def disable_queued_logging(logger_name: str = AdvancedConservationTracker.__name__):
+    """
+    Undo enable_queued_logging, flushing records still in the queue
+    
+    :param logger_name: Logger passed to enable_queued_logging
+    """
+    existing = _queue_listeners.pop(logger_name, None)
+    if existing is None:
+        return
+    
+    listener, queue_handler, propagate = existing
+    logger = logging.getLogger(logger_name)
+    logger.removeHandler(queue_handler)
+    logger.propagate = propagate
+    listener.stop()